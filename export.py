@@ -0,0 +1,168 @@
+import argparse
+import os
+import queue
+import threading
+
+import numpy as np
+
+from simulate import play
+
+# Value of a cell in the visible board that has not been revealed
+HIDDEN = -1
+
+# Channels of each position in a shard
+BOARD, SAFES, MINES, TRUTH = range(4)
+
+
+def encode(game, ai, revealed):
+    """
+    Returns the arrays (board, safes, mines) for the current position.
+
+    `board` holds the number of nearby mines for each revealed cell,
+    and HIDDEN everywhere else. `safes` and `mines` are 1 for the cells
+    the AI currently knows to be safe or to be mines.
+    """
+    board = np.full((game.height, game.width), HIDDEN, dtype=np.int8)
+    for cell, nearby in revealed.items():
+        board[cell] = nearby
+
+    safes = np.zeros((game.height, game.width), dtype=np.int8)
+    for cell in ai.safes:
+        safes[cell] = 1
+
+    mines = np.zeros((game.height, game.width), dtype=np.int8)
+    for cell in ai.mines:
+        mines[cell] = 1
+
+    return board, safes, mines
+
+
+def positions(games, height=8, width=8, mines=8, seed=0):
+    """
+    Plays `games` seeded games and yields, before each move,
+    a tuple (board, safes, mines, truth) where `truth` is 1
+    for every cell that actually holds a mine.
+    """
+    for n in range(games):
+        truth = None
+        for game, ai, revealed, move in play(height, width, mines, seed + n):
+            if truth is None:
+                truth = np.array(game.board, dtype=np.int8)
+            yield encode(game, ai, revealed) + (truth,)
+
+
+class ShardWriter():
+    """
+    Writes positions to numbered .npy shards of at most `chunk_size`
+    positions each, shaped (positions, 4, height, width).
+
+    Full chunks are handed to a background thread, so that saving one
+    shard overlaps with filling the next. At most `pending` chunks wait
+    to be written at any time, which bounds memory use.
+    Shards can be read back with np.load(path, mmap_mode="r").
+    """
+
+    def __init__(self, directory, height, width, chunk_size=4096, pending=2):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.shape = (chunk_size, 4, height, width)
+        self.shards = 0
+        self.error = None
+
+        os.makedirs(directory, exist_ok=True)
+        self.chunk = np.empty(self.shape, dtype=np.int8)
+        self.filled = 0
+
+        self.queue = queue.Queue(maxsize=pending)
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, position):
+        """
+        Adds one (board, safes, mines, truth) position to the current chunk.
+        """
+        for channel, array in enumerate(position):
+            self.chunk[self.filled, channel] = array
+        self.filled += 1
+        if self.filled == self.chunk_size:
+            self._flush()
+
+    def close(self):
+        """
+        Writes any remaining positions and waits for the writer thread.
+        """
+        try:
+            if self.filled:
+                self._flush()
+        finally:
+            self.queue.put(None)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _flush(self):
+        if self.error is not None:
+            raise self.error
+        path = os.path.join(self.directory, f"shard-{self.shards:05d}.npy")
+        self.queue.put((path, self.chunk[:self.filled]))
+        self.shards += 1
+        self.chunk = np.empty(self.shape, dtype=np.int8)
+        self.filled = 0
+
+    def _write(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                continue
+            path, chunk = item
+            try:
+                np.save(path, chunk)
+            except Exception as e:
+                self.error = e
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export MinesweeperAI positions as training data."
+    )
+    parser.add_argument("directory", help="where to write the shards")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--height", type=int, default=8)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--mines", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first game; game n uses seed + n")
+    parser.add_argument("--chunk-size", type=int, default=4096,
+                        help="number of positions per shard")
+    args = parser.parse_args()
+    if args.height < 1 or args.width < 1:
+        parser.error("the board needs at least one row and one column")
+    if not 0 <= args.mines < args.height * args.width:
+        parser.error("mines must leave at least one safe cell")
+    if args.chunk_size < 1:
+        parser.error("chunk-size must be at least 1")
+    if args.games < 0:
+        parser.error("games must not be negative")
+
+    count = 0
+    with ShardWriter(args.directory, args.height, args.width,
+                     chunk_size=args.chunk_size) as writer:
+        for position in positions(args.games, args.height, args.width,
+                                  args.mines, args.seed):
+            writer.add(position)
+            count += 1
+
+    print(f"Wrote {count} positions from {args.games} games "
+          f"to {writer.shards} shards in {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
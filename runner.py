@@ -1,4 +1,7 @@
-import pygame
+import argparse
+import functools
+import os
+import random
 import sys
 import time
 
@@ -13,210 +16,279 @@ BLACK = (0, 0, 0)
 GRAY = (180, 180, 180)
 WHITE = (255, 255, 255)
 
-# Create game
-pygame.init()
-size = width, height = 600, 400
-screen = pygame.display.set_mode(size)
+# Assets
+ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+OPEN_SANS = os.path.join(ASSETS, "fonts", "OpenSans-Regular.ttf")
 
-# Fonts
-OPEN_SANS = "assets/fonts/OpenSans-Regular.ttf"
-smallFont = pygame.font.Font(OPEN_SANS, 20)
-mediumFont = pygame.font.Font(OPEN_SANS, 28)
-largeFont = pygame.font.Font(OPEN_SANS, 40)
-
-# Compute board size
+# Window and board layout
+SIZE = 600, 400
 BOARD_PADDING = 20
-board_width = ((2 / 3) * width) - (BOARD_PADDING * 2)
-board_height = height - (BOARD_PADDING * 2)
-cell_size = int(min(board_width / WIDTH, board_height / HEIGHT))
-board_origin = (BOARD_PADDING, BOARD_PADDING)
-
-# Add images
-flag = pygame.image.load("assets/images/flag.png")
-flag = pygame.transform.scale(flag, (cell_size, cell_size))
-mine = pygame.image.load("assets/images/mine.png")
-mine = pygame.transform.scale(mine, (cell_size, cell_size))
-
-# Create game and AI agent
-game = Minesweeper(height=HEIGHT, width=WIDTH, mines=MINES)
-ai = MinesweeperAI(height=HEIGHT, width=WIDTH)
-
-# Keep track of revealed cells, flagged cells, and if a mine was hit
-revealed = set()
-flags = set()
-lost = False
-
-# Show instructions initially
-instructions = True
-
-while True:
-
-    # Check if game quit
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            sys.exit()
-
-    screen.fill(BLACK)
-
-    # Show game instructions
-    if instructions:
-
-        # Title
-        title = largeFont.render("Play Minesweeper", True, WHITE)
-        titleRect = title.get_rect()
-        titleRect.center = ((width / 2), 50)
-        screen.blit(title, titleRect)
-
-        # Rules
-        rules = [
-            "Click a cell to reveal it.",
-            "Right-click a cell to mark it as a mine.",
-            "Mark all mines successfully to win!"
-        ]
-        for i, rule in enumerate(rules):
-            line = smallFont.render(rule, True, WHITE)
-            lineRect = line.get_rect()
-            lineRect.center = ((width / 2), 150 + 30 * i)
-            screen.blit(line, lineRect)
-
-        # Play game button
-        buttonRect = pygame.Rect((width / 4), (3 / 4) * height, width / 2, 50)
-        buttonText = mediumFont.render("Play Game", True, BLACK)
-        buttonTextRect = buttonText.get_rect()
-        buttonTextRect.center = buttonRect.center
-        pygame.draw.rect(screen, WHITE, buttonRect)
-        screen.blit(buttonText, buttonTextRect)
-
-        # Check if play button clicked
-        click, _, _ = pygame.mouse.get_pressed()
-        if click == 1:
-            mouse = pygame.mouse.get_pos()
-            if buttonRect.collidepoint(mouse):
-                instructions = False
-                time.sleep(0.3)
+BOARD_WIDTH = ((2 / 3) * SIZE[0]) - (BOARD_PADDING * 2)
+BOARD_HEIGHT = SIZE[1] - (BOARD_PADDING * 2)
+
+# Smallest cell that still shows its border and number
+MIN_CELL_SIZE = 12
+MAX_WIDTH = int(BOARD_WIDTH // MIN_CELL_SIZE)
+MAX_HEIGHT = int(BOARD_HEIGHT // MIN_CELL_SIZE)
+
+
+@functools.lru_cache(maxsize=None)
+def font(size):
+    """
+    Returns the Open Sans font at the given size,
+    loading it the first time it is needed.
+    """
+    import pygame
+    return pygame.font.Font(OPEN_SANS, size)
+
+
+@functools.lru_cache(maxsize=None)
+def load_image(name):
+    """
+    Loads an image from the assets folder once.
+    """
+    import pygame
+    return pygame.image.load(os.path.join(ASSETS, "images", name))
+
+
+@functools.lru_cache(maxsize=None)
+def image(name, size):
+    """
+    Returns an image from the assets folder scaled to a square
+    of the given size, scaling it once per size.
+    """
+    import pygame
+    return pygame.transform.scale(load_image(name), (size, size))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play Minesweeper with an AI.")
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--mines", type=int, default=MINES)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for the board and the AI's random moves")
+    args = parser.parse_args(argv)
+    if args.height < 1 or args.width < 1:
+        parser.error("the board needs at least one row and one column")
+    if args.width > MAX_WIDTH or args.height > MAX_HEIGHT:
+        parser.error(f"the board must fit the window: at most "
+                     f"{MAX_WIDTH} columns and {MAX_HEIGHT} rows")
+    if not 0 <= args.mines < args.height * args.width:
+        parser.error("mines must leave at least one safe cell")
+    return args
+
+
+def main(argv=None):
+    # Measure startup from the moment the runner is launched
+    started = time.perf_counter()
+    args = parse_args(argv)
+
+    import pygame
+
+    # Create game
+    pygame.init()
+    size = width, height = SIZE
+    screen = pygame.display.set_mode(size)
+
+    # Compute board size
+    cell_size = int(min(BOARD_WIDTH / args.width, BOARD_HEIGHT / args.height))
+    board_origin = (BOARD_PADDING, BOARD_PADDING)
+
+    # Keep numbers inside their cells on large boards
+    number_size = max(8, min(20, cell_size - 4))
+
+    # Create game and AI agent
+    if args.seed is not None:
+        random.seed(args.seed)
+    game = Minesweeper(height=args.height, width=args.width, mines=args.mines)
+    ai = MinesweeperAI(height=args.height, width=args.width)
+
+    # Keep track of revealed cells, flagged cells, and if a mine was hit
+    revealed = set()
+    flags = set()
+    lost = False
+
+    # Show instructions initially
+    instructions = True
+
+    while True:
+
+        # Check if game quit
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                sys.exit()
+
+        screen.fill(BLACK)
+
+        # Show game instructions
+        if instructions:
+
+            # Title
+            title = font(40).render("Play Minesweeper", True, WHITE)
+            titleRect = title.get_rect()
+            titleRect.center = ((width / 2), 50)
+            screen.blit(title, titleRect)
+
+            # Rules
+            rules = [
+                "Click a cell to reveal it.",
+                "Right-click a cell to mark it as a mine.",
+                "Mark all mines successfully to win!"
+            ]
+            for i, rule in enumerate(rules):
+                line = font(20).render(rule, True, WHITE)
+                lineRect = line.get_rect()
+                lineRect.center = ((width / 2), 150 + 30 * i)
+                screen.blit(line, lineRect)
+
+            # Play game button
+            buttonRect = pygame.Rect((width / 4), (3 / 4) * height, width / 2, 50)
+            buttonText = font(28).render("Play Game", True, BLACK)
+            buttonTextRect = buttonText.get_rect()
+            buttonTextRect.center = buttonRect.center
+            pygame.draw.rect(screen, WHITE, buttonRect)
+            screen.blit(buttonText, buttonTextRect)
+
+            # Check if play button clicked
+            click, _, _ = pygame.mouse.get_pressed()
+            if click == 1:
+                mouse = pygame.mouse.get_pos()
+                if buttonRect.collidepoint(mouse):
+                    instructions = False
+                    time.sleep(0.3)
+
+            pygame.display.flip()
+
+            # Report how long it took to show the first frame
+            if started is not None:
+                print(f"Started in {(time.perf_counter() - started) * 1000:.0f} ms")
+                started = None
+            continue
 
-        pygame.display.flip()
-        continue
-
-    # Draw board
-    cells = []
-    for i in range(HEIGHT):
-        row = []
-        for j in range(WIDTH):
-
-            # Draw rectangle for cell
-            rect = pygame.Rect(
-                board_origin[0] + j * cell_size,
-                board_origin[1] + i * cell_size,
-                cell_size, cell_size
-            )
-            pygame.draw.rect(screen, GRAY, rect)
-            pygame.draw.rect(screen, WHITE, rect, 3)
-
-            # Add a mine, flag, or number if needed
-            if game.is_mine((i, j)) and lost:
-                screen.blit(mine, rect)
-            elif (i, j) in flags:
-                screen.blit(flag, rect)
-            elif (i, j) in revealed:
-                neighbors = smallFont.render(
-                    str(game.nearby_mines((i, j))),
-                    True, BLACK
+        # Draw board
+        cells = []
+        for i in range(args.height):
+            row = []
+            for j in range(args.width):
+
+                # Draw rectangle for cell
+                rect = pygame.Rect(
+                    board_origin[0] + j * cell_size,
+                    board_origin[1] + i * cell_size,
+                    cell_size, cell_size
                 )
-                neighborsTextRect = neighbors.get_rect()
-                neighborsTextRect.center = rect.center
-                screen.blit(neighbors, neighborsTextRect)
-
-            row.append(rect)
-        cells.append(row)
-
-    # AI Move button
-    aiButton = pygame.Rect(
-        (2 / 3) * width + BOARD_PADDING, (1 / 3) * height - 50,
-        (width / 3) - BOARD_PADDING * 2, 50
-    )
-    buttonText = mediumFont.render("AI Move", True, BLACK)
-    buttonRect = buttonText.get_rect()
-    buttonRect.center = aiButton.center
-    pygame.draw.rect(screen, WHITE, aiButton)
-    screen.blit(buttonText, buttonRect)
-
-    # Reset button
-    resetButton = pygame.Rect(
-        (2 / 3) * width + BOARD_PADDING, (1 / 3) * height + 20,
-        (width / 3) - BOARD_PADDING * 2, 50
-    )
-    buttonText = mediumFont.render("Reset", True, BLACK)
-    buttonRect = buttonText.get_rect()
-    buttonRect.center = resetButton.center
-    pygame.draw.rect(screen, WHITE, resetButton)
-    screen.blit(buttonText, buttonRect)
-
-    # Display text
-    text = "Lost" if lost else "Won" if game.mines == flags else ""
-    text = mediumFont.render(text, True, WHITE)
-    textRect = text.get_rect()
-    textRect.center = ((5 / 6) * width, (2 / 3) * height)
-    screen.blit(text, textRect)
-
-    move = None
-
-    left, _, right = pygame.mouse.get_pressed()
-
-    # Check for a right-click to toggle flagging
-    if right == 1 and not lost:
-        mouse = pygame.mouse.get_pos()
-        for i in range(HEIGHT):
-            for j in range(WIDTH):
-                if cells[i][j].collidepoint(mouse) and (i, j) not in revealed:
-                    if (i, j) in flags:
-                        flags.remove((i, j))
-                    else:
-                        flags.add((i, j))
-                    time.sleep(0.2)
-
-    elif left == 1:
-        mouse = pygame.mouse.get_pos()
+                pygame.draw.rect(screen, GRAY, rect)
+                pygame.draw.rect(screen, WHITE, rect, 3)
+
+                # Add a mine, flag, or number if needed
+                if game.is_mine((i, j)) and lost:
+                    screen.blit(image("mine.png", cell_size), rect)
+                elif (i, j) in flags:
+                    screen.blit(image("flag.png", cell_size), rect)
+                elif (i, j) in revealed:
+                    neighbors = font(number_size).render(
+                        str(game.nearby_mines((i, j))),
+                        True, BLACK
+                    )
+                    neighborsTextRect = neighbors.get_rect()
+                    neighborsTextRect.center = rect.center
+                    screen.blit(neighbors, neighborsTextRect)
+
+                row.append(rect)
+            cells.append(row)
+
+        # AI Move button
+        aiButton = pygame.Rect(
+            (2 / 3) * width + BOARD_PADDING, (1 / 3) * height - 50,
+            (width / 3) - BOARD_PADDING * 2, 50
+        )
+        buttonText = font(28).render("AI Move", True, BLACK)
+        buttonRect = buttonText.get_rect()
+        buttonRect.center = aiButton.center
+        pygame.draw.rect(screen, WHITE, aiButton)
+        screen.blit(buttonText, buttonRect)
+
+        # Reset button
+        resetButton = pygame.Rect(
+            (2 / 3) * width + BOARD_PADDING, (1 / 3) * height + 20,
+            (width / 3) - BOARD_PADDING * 2, 50
+        )
+        buttonText = font(28).render("Reset", True, BLACK)
+        buttonRect = buttonText.get_rect()
+        buttonRect.center = resetButton.center
+        pygame.draw.rect(screen, WHITE, resetButton)
+        screen.blit(buttonText, buttonRect)
+
+        # Display text
+        text = "Lost" if lost else "Won" if game.mines == flags else ""
+        text = font(28).render(text, True, WHITE)
+        textRect = text.get_rect()
+        textRect.center = ((5 / 6) * width, (2 / 3) * height)
+        screen.blit(text, textRect)
+
+        move = None
+
+        left, _, right = pygame.mouse.get_pressed()
+
+        # Check for a right-click to toggle flagging
+        if right == 1 and not lost:
+            mouse = pygame.mouse.get_pos()
+            for i in range(args.height):
+                for j in range(args.width):
+                    if cells[i][j].collidepoint(mouse) and (i, j) not in revealed:
+                        if (i, j) in flags:
+                            flags.remove((i, j))
+                        else:
+                            flags.add((i, j))
+                        time.sleep(0.2)
+
+        elif left == 1:
+            mouse = pygame.mouse.get_pos()
 
-        # If AI button clicked, make an AI move
-        if aiButton.collidepoint(mouse) and not lost:
-            move = ai.make_safe_move()
-            if move is None:
-                move = ai.make_random_move()
+            # If AI button clicked, make an AI move
+            if aiButton.collidepoint(mouse) and not lost:
+                move = ai.make_safe_move()
                 if move is None:
-                    flags = ai.mines.copy()
-                    print("No moves left to make.")
+                    move = ai.make_random_move()
+                    if move is None:
+                        flags = ai.mines.copy()
+                        print("No moves left to make.")
+                    else:
+                        print("No known safe moves, AI making random move.")
                 else:
-                    print("No known safe moves, AI making random move.")
+                    print("AI making safe move.")
+                time.sleep(0.2)
+
+            # Reset game state
+            elif resetButton.collidepoint(mouse):
+                game = Minesweeper(height=args.height, width=args.width, mines=args.mines)
+                ai = MinesweeperAI(height=args.height, width=args.width)
+                revealed = set()
+                flags = set()
+                lost = False
+                continue
+
+            # User-made move
+            elif not lost:
+                for i in range(args.height):
+                    for j in range(args.width):
+                        if (cells[i][j].collidepoint(mouse)
+                                and (i, j) not in flags
+                                and (i, j) not in revealed):
+                            move = (i, j)
+
+        # Make move and update AI knowledge
+        if move:
+            if game.is_mine(move):
+                lost = True
             else:
-                print("AI making safe move.")
-            time.sleep(0.2)
-
-        # Reset game state
-        elif resetButton.collidepoint(mouse):
-            game = Minesweeper(height=HEIGHT, width=WIDTH, mines=MINES)
-            ai = MinesweeperAI(height=HEIGHT, width=WIDTH)
-            revealed = set()
-            flags = set()
-            lost = False
-            continue
+                nearby = game.nearby_mines(move)
+                revealed.add(move)
+                ai.add_knowledge(move, nearby)
+
+        pygame.display.flip()
+
 
-        # User-made move
-        elif not lost:
-            for i in range(HEIGHT):
-                for j in range(WIDTH):
-                    if (cells[i][j].collidepoint(mouse)
-                            and (i, j) not in flags
-                            and (i, j) not in revealed):
-                        move = (i, j)
-
-    # Make move and update AI knowledge
-    if move:
-        if game.is_mine(move):
-            lost = True
-        else:
-            nearby = game.nearby_mines(move)
-            revealed.add(move)
-            ai.add_knowledge(move, nearby)
-
-    pygame.display.flip()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import contextlib
+import os
+import random
+
+from minesweeper import Minesweeper, MinesweeperAI
+
+
+# The AI prints its reasoning on every move, so games played
+# without a window send that output here instead.
+_devnull = None
+
+
+@contextlib.contextmanager
+def quiet():
+    """
+    Silences anything printed to stdout inside the block.
+    """
+    global _devnull
+    if _devnull is None:
+        _devnull = open(os.devnull, "w")
+    with contextlib.redirect_stdout(_devnull):
+        yield
+
+
+def play(height=8, width=8, mines=8, seed=None):
+    """
+    Plays one game of MinesweeperAI against a new Minesweeper board,
+    without any window.
+
+    Before each move is made, yields a tuple (game, ai, revealed, move),
+    where `revealed` maps each revealed cell to its number of nearby
+    mines and `move` is the cell the AI is about to choose.
+
+    Returns True if the AI won the game and False if it hit a mine.
+    If `seed` is given, the board and the AI's random moves are
+    reproducible.
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    game = Minesweeper(height=height, width=width, mines=mines)
+    ai = MinesweeperAI(height=height, width=width)
+    revealed = {}
+
+    while True:
+
+        # Every safe cell revealed means the game is won
+        if len(revealed) == height * width - mines:
+            return True
+
+        with quiet():
+            move = ai.make_safe_move()
+            if move is None:
+                move = ai.make_random_move()
+
+        # Fallback: no moves left means every other cell is a known mine
+        if move is None:
+            return True
+
+        yield game, ai, revealed, move
+
+        if game.is_mine(move):
+            return False
+
+        nearby = game.nearby_mines(move)
+        revealed[move] = nearby
+        with quiet():
+            ai.add_knowledge(move, nearby)
+
+
+def run(height=8, width=8, mines=8, seed=None):
+    """
+    Plays one game to the end and returns True if the AI won.
+    """
+    steps = play(height=height, width=width, mines=mines, seed=seed)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
@@ -0,0 +1,169 @@
+import argparse
+import csv
+import itertools
+import math
+import os
+
+from simulate import run
+
+FIELDS = ["height", "width", "mines", "games", "wins"]
+
+
+def interval(wins, games, z=1.96):
+    """
+    Returns the Wilson score interval (low, high) for a win rate
+    of `wins` out of `games`, at the confidence given by `z`.
+    """
+    if games == 0:
+        return 0.0, 1.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games))
+    margin /= denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def load(path):
+    """
+    Returns a dict mapping each (height, width, mines) point
+    to its [games, wins] so far, read from the results file at `path`.
+    """
+    totals = {}
+    if not os.path.exists(path):
+        return totals
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            point = (int(row["height"]), int(row["width"]), int(row["mines"]))
+            total = totals.setdefault(point, [0, 0])
+            total[0] += int(row["games"])
+            total[1] += int(row["wins"])
+    return totals
+
+
+def sweep(points, path, max_spread=0.05, batch=20, min_games=40,
+          max_games=2000, budget=None, seed=0):
+    """
+    Plays games at each (height, width, mines) point until its win-rate
+    interval is no wider than `max_spread`, or it has had `max_games` games.
+
+    Every point first gets `min_games` games. After that, each batch goes
+    to the unfinished point with the widest interval, so games saved on
+    points that settle quickly are spent on the uncertain ones.
+    Stops early after `budget` new games, if given.
+
+    Each batch is appended to the CSV file at `path` as soon as it is
+    played, and results already in that file are counted, so an
+    interrupted sweep resumes where it stopped.
+    Returns the dict of [games, wins] per point.
+    """
+    totals = load(path)
+    for point in points:
+        totals.setdefault(point, [0, 0])
+
+    def spread(point):
+        games, wins = totals[point]
+        low, high = interval(wins, games)
+        return high - low
+
+    def active(point):
+        games = totals[point][0]
+        if games >= max_games:
+            return False
+        return games < min_games or spread(point) > max_spread
+
+    # A file left empty by an interrupted run still needs its header
+    new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+    played = 0
+    with open(path, "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+            f.flush()
+
+        while budget is None or played < budget:
+            candidates = [point for point in points if active(point)]
+            if not candidates:
+                break
+
+            # Fill up every point to min_games before adapting
+            starving = [p for p in candidates if totals[p][0] < min_games]
+            point = starving[0] if starving else max(candidates, key=spread)
+
+            height, width, mines = point
+            games = totals[point][0]
+            n = min(batch, max_games - games)
+            if budget is not None:
+                n = min(n, budget - played)
+
+            wins = sum(
+                run(height, width, mines,
+                    seed=f"{seed}-{height}x{width}-{mines}-{games + i}")
+                for i in range(n)
+            )
+
+            totals[point][0] += n
+            totals[point][1] += wins
+            played += n
+            writer.writerow({"height": height, "width": width,
+                             "mines": mines, "games": n, "wins": wins})
+            f.flush()
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure MinesweeperAI win rate over board sizes "
+                    "and mine counts."
+    )
+    parser.add_argument("--heights", type=int, nargs="+", default=[8])
+    parser.add_argument("--widths", type=int, nargs="+", default=[8])
+    parser.add_argument("--mines", type=int, nargs="+", default=[8])
+    parser.add_argument("--output", default="sweep.csv",
+                        help="results file, resumed if it exists")
+    parser.add_argument("--interval", type=float, default=0.05,
+                        help="target width of the 95%% confidence interval")
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--min-games", type=int, default=40)
+    parser.add_argument("--max-games", type=int, default=2000)
+    parser.add_argument("--budget", type=int, default=None,
+                        help="maximum number of new games to play")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.batch < 1:
+        parser.error("batch must be at least 1")
+    if args.min_games < 0:
+        parser.error("min-games must not be negative")
+    if args.interval <= 0:
+        parser.error("interval must be positive")
+    if min(args.heights) < 1 or min(args.widths) < 1:
+        parser.error("boards need at least one row and one column")
+
+    # Skip boards with no room for a safe cell
+    points = []
+    for height, width, mines in itertools.product(
+            args.heights, args.widths, args.mines):
+        if 0 <= mines < height * width:
+            points.append((height, width, mines))
+        else:
+            print(f"Skipping {height}x{width} with {mines} mines: "
+                  f"mines must leave at least one safe cell")
+
+    totals = sweep(points, args.output, max_spread=args.interval,
+                   batch=args.batch, min_games=args.min_games,
+                   max_games=args.max_games, budget=args.budget,
+                   seed=args.seed)
+
+    print(f"{'board':>9} {'mines':>6} {'games':>6} {'win rate':>9}  interval")
+    for height, width, mines in points:
+        games, wins = totals[(height, width, mines)]
+        if games == 0:
+            continue
+        low, high = interval(wins, games)
+        print(f"{height:>4}x{width:<4} {mines:>6} {games:>6} "
+              f"{wins / games:>9.3f}  [{low:.3f}, {high:.3f}]")
+
+
+if __name__ == "__main__":
+    main()